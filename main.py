@@ -8,6 +8,7 @@ PDF to Database - 최종 통합 메인 프로그램
     python main.py document.pdf       # 특정 PDF 파일 처리
     python main.py --sample           # 샘플 데이터로 테스트
     python main.py --skip-db          # DB 적재 건너뛰기
+    python main.py --parquet          # CSV와 함께 Parquet 파일도 저장
 """
 
 import os
@@ -37,14 +38,16 @@ logger = logging.getLogger(__name__)
 class PDFtoDBPipeline:
     """PDF to Database 완전한 파이프라인"""
     
-    def __init__(self, skip_db: bool = False, use_sample: bool = False):
+    def __init__(self, skip_db: bool = False, use_sample: bool = False, parquet: bool = False):
         """
         Args:
             skip_db: DB 적재 건너뛰기
             use_sample: 샘플 데이터 사용
+            parquet: 정규화 결과를 Parquet으로도 저장 (pyarrow 필요)
         """
         self.skip_db = skip_db
         self.use_sample = use_sample
+        self.parquet = parquet
         
         # 디렉토리 설정
         self.input_dir = Path("input")
@@ -184,6 +187,8 @@ class PDFtoDBPipeline:
                 return False
             
             normalizer.save_to_csv()
+            if self.parquet:
+                normalizer.save_to_parquet()
             normalizer.print_statistics()
             
             # 통계 업데이트
@@ -220,6 +225,8 @@ class PDFtoDBPipeline:
             normalizer = GovernmentStandardNormalizer(str(json_file), str(self.normalized_dir))
             normalizer.normalize(json_data)
             normalizer.save_to_csv()
+            if self.parquet:
+                normalizer.save_to_parquet()
             normalizer.print_statistics()
             
             # 통계
@@ -392,6 +399,7 @@ def main():
   python main.py doc1.pdf doc2.pdf  # 특정 PDF 파일들 처리
   python main.py --sample           # 샘플 데이터로 테스트
   python main.py --skip-db          # DB 적재 건너뛰기
+  python main.py --parquet          # CSV와 함께 Parquet 파일도 저장
         """
     )
     
@@ -413,12 +421,19 @@ def main():
         help='데이터베이스 적재 건너뛰기'
     )
     
+    parser.add_argument(
+        '--parquet',
+        action='store_true',
+        help='정규화 결과를 Parquet 파일로도 저장 (pyarrow 필요)'
+    )
+    
     args = parser.parse_args()
     
     # 파이프라인 실행
     pipeline = PDFtoDBPipeline(
         skip_db=args.skip_db,
-        use_sample=args.sample
+        use_sample=args.sample,
+        parquet=args.parquet
     )
     
     success = pipeline.run(args.pdf_files)
@@ -4,7 +4,13 @@
 """
 import json
 import csv
+import itertools
 import re
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields, is_dataclass
+from functools import lru_cache
+from operator import attrgetter, itemgetter
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
@@ -18,6 +24,267 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# JSON 직렬화/파싱 (orjson이 있으면 사용, 없으면 표준 json)
+# 두 경로 모두 공백 없는 UTF-8 JSON을 생성하여 출력이 동일함
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+
+    _json_loads = orjson.loads
+except ImportError:
+    # json.dumps는 옵션이 있으면 호출마다 인코더를 새로 만들므로 인스턴스를 재사용
+    _json_dumps = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+    _json_loads = json.loads
+
+
+# CSV 동시 기록 스레드 수 (파일 쓰기는 GIL을 해제하므로 I/O가 겹침)
+CSV_WRITE_WORKERS = 4
+
+# CSV 파일 쓰기 버퍼 크기 (기본 8KB 대신 1MB 단위로 모아서 write 호출 횟수 감소)
+CSV_WRITE_BUFFER = 1 << 20
+
+# 숫자 셀 판별 (콤마/단위 제거 후): 예외 없이 float 변환 가능 여부 확인
+# float()이 받는 십진 표기(+5, 5., .5, 1e3 등)는 모두 허용, inf/nan/밑줄 구분자는 제외
+_NUMERIC_RE = re.compile(r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+
+
+# 일정 구분 문구 파싱 캐시 크기 (프로세스 수명 동안 상주하므로 상한을 둠)
+PERIOD_CACHE_SIZE = 1024
+
+# 숫자 정리용 삭제 테이블 (str.translate로 한 번에 제거)
+_COMMA_STRIP = str.maketrans('', '', ',')
+
+# 일정/예산 파싱 패턴 (모듈 로드 시 한 번만 컴파일)
+_QUARTER_RANGE_RE = re.compile(r'(\d)/4\s*분기\s*~\s*(\d)/4\s*분기')
+_QUARTER_SINGLE_RE = re.compile(r'(\d)/4\s*분기')
+_YEAR_RE = re.compile(r'(20\d{2})')
+
+# 예산 행 분류: 합계/헤더 행 제외 패턴, 첫 컬럼 키워드 → 예산 타입 (우선순위 순)
+_BUDGET_SKIP_RE = re.compile('소계|합계|총계|구분')
+_BUDGET_TYPE_KEYWORDS = (
+    ('정부', '정부'),
+    ('국비', '정부'),
+    ('민간', '민간'),
+    ('지방', '지방비'),
+)
+
+# 본문 텍스트 섹션 추출 패턴
+_ACHIEVEMENT_SECTION_RE = re.compile(r'①\s*대표성과(.*?)(?:②|③|\(2\)|\(3\)|$)', re.DOTALL)
+_ACHIEVEMENT_SPLIT_RE = re.compile(r'\n○\s+')
+_PLAN_SECTION_RE = re.compile(r'①\s*주요\s*추진계획\s*내용(.*?)(?:②|③|\(2\)|\(3\)|$)', re.DOTALL)
+# 계획연도 추진계획 섹션 패턴 템플릿 - 연도는 _plan_fallback_re()에서 채움
+_PLAN_FALLBACK_TEMPLATE = r'\(3\)\s*{year}년도\s*추진계획\s*①\s*(.*?)(?:②|③|$)'
+_PLAN_SPLIT_RE = re.compile(r'\n[○\-]\s+')
+_OBJECTIVE_RE = re.compile(r'○\s*사업목표\s*(.*?)(?:○\s*사업내용|$)', re.DOTALL)
+_CONTENT_RE = re.compile(r'○\s*사업내용\s*(.*?)(?:\(2\)|②|$)', re.DOTALL)
+_SUB_PROJECT_NAME_RE = re.compile(r'내역사업명\s+([^\n]+)')
+_MAIN_PROJECT_NAME_RE = re.compile(r'세부사업명\s+([^\n]+)')
+
+# 테이블 타입 판별 키워드 - 전방탐색으로 겹치는 키워드까지 한 번의 스캔으로 수집
+_TABLE_KEYWORDS = (
+    '사업비', '구분', '실적', '계획', '특허성과', '논문성과', '기술이전', '기술료',
+    '국제협력', '해외연구자', '학위배출', '박사', '일정', '분기', '추진', '예산',
+)
+_TABLE_TYPE_RE = re.compile('(?=(' + '|'.join(_TABLE_KEYWORDS) + '))')
+
+# 성과 테이블 타입별 (최소 행 수, [(지표 분류, 지표 유형, 컬럼 인덱스, 단위), ...])
+# 각 테이블의 마지막 행이 실제 데이터 행
+_PERF_SPECS = {
+    # 특허/논문 복합 테이블: 특허 0-3번, 논문 4-7번 컬럼
+    'patent_paper': (4, (
+        ('특허', '국내출원', 0, '건'),
+        ('특허', '국내등록', 1, '건'),
+        ('특허', '국외출원', 2, '건'),
+        ('특허', '국외등록', 3, '건'),
+        ('논문', 'IF20이상', 4, '편'),
+        ('논문', 'IF10이상', 5, '편'),
+        ('논문', 'SCIE', 6, '편'),
+        ('논문', '비SCIE', 7, '편'),
+    )),
+    'tech_transfer': (3, (
+        ('기술이전', '기술지도', 0, '건'),
+        ('기술이전', '기술이전', 1, '건'),
+        ('기술이전', '기술료', 3, '백만원'),
+    )),
+    'international': (3, (
+        ('국제협력', '해외연구자유치', 0, '명'),
+        ('국제협력', '국내연구자파견', 1, '명'),
+        ('국제협력', '국제학술회의개최', 2, '건'),
+    )),
+    'human_resources': (3, (
+        ('인력양성', '박사배출', 0, '명'),
+        ('인력양성', '석사배출', 1, '명'),
+        ('인력양성', '연구과제참여인력', 4, '명'),
+    )),
+}
+
+# 분기별 (시작월, 종료월, 시작일, 종료일) - 0은 연간 일정
+_QUARTER_PERIODS = {
+    0: (1, 12, '01-01', '12-31'),
+    1: (1, 3, '01-01', '03-31'),
+    2: (4, 6, '04-01', '06-30'),
+    3: (7, 9, '07-01', '09-30'),
+    4: (10, 12, '10-01', '12-31'),
+}
+
+
+def _canonical_name(name: Any) -> str:
+    """내역사업명 비교용 정규형 (앞뒤 공백 제거 + 유니코드 NFC)
+
+    PDF 추출 경로에 따라 같은 이름이 조합형(NFD) 한글로 들어오는 경우가 있어
+    이름 인덱스의 키는 항상 이 값으로 통일한다. JSON의 sub_project가 숫자 등
+    문자열이 아닌 값이어도 페이지 처리가 중단되지 않도록 str()로 변환한다.
+    """
+    return unicodedata.normalize('NFC', str(name).strip())
+
+
+@lru_cache(maxsize=16)
+def _plan_fallback_re(plan_year: int) -> re.Pattern:
+    """계획연도의 "(3) YYYY년도 추진계획 ①" 섹션 패턴 (연도별 한 번만 컴파일)
+
+    페이지 게이트(plan_heading)와 같은 연도만 매칭해야 이전 연도 섹션이 먼저 나오는
+    페이지에서 엉뚱한 섹션을 잡지 않는다.
+    """
+    return re.compile(_PLAN_FALLBACK_TEMPLATE.format(year=re.escape(str(plan_year))), re.DOTALL)
+
+
+@lru_cache(maxsize=PERIOD_CACHE_SIZE)
+def _extract_quarters(period_text: str) -> Tuple[int, ...]:
+    """일정 구분 텍스트에서 분기 목록 추출 (1~4분기 외의 값은 분기 정보 없음)
+
+    같은 구분 문구("1/4분기", "연중" 등)가 행마다 반복되므로 결과를 캐시
+    (자유 서술 셀이 섞여 있어 캐시 크기는 PERIOD_CACHE_SIZE로 제한)
+    """
+    quarters = ()
+    # Case 1: 병합된 분기 (1/4분기 ~ 2/4분기)
+    if '~' in period_text and '분기' in period_text:
+        quarter_match = _QUARTER_RANGE_RE.search(period_text)
+        if quarter_match:
+            start_q = int(quarter_match.group(1))
+            end_q = int(quarter_match.group(2))
+            quarters = range(start_q, end_q + 1)
+    # Case 2: 연중
+    elif '연중' in period_text:
+        quarters = (1, 2, 3, 4)
+    # Case 3: 단일 분기
+    elif '분기' in period_text:
+        quarter_match = _QUARTER_SINGLE_RE.search(period_text)
+        if quarter_match:
+            quarters = (int(quarter_match.group(1)),)
+    return tuple(q for q in quarters if 1 <= q <= 4)
+
+
+def _table_key_values(tables: List[Dict]) -> List[Tuple[str, str]]:
+    """키-값 형식 테이블(1열=항목, 2열=내용)의 (키, 값) 쌍 목록 - 셀은 strip 처리
+
+    내역사업 등록과 사업개요 처리가 같은 페이지 테이블을 읽으므로 페이지당 한 번만 생성
+    """
+    return [
+        (str(row[0]).strip(), str(row[1]).strip())
+        for table in tables
+        for row in table.get('data', [])
+        if len(row) >= 2
+    ]
+
+
+# ==================== 정규화 레코드 ====================
+# 건수가 많은 정규화 테이블은 dict 대신 슬롯 dataclass로 보관 (레코드당 메모리 절감)
+# 필드 순서 = CSV 컬럼 순서 = DB 스키마 컬럼 순서
+
+@dataclass(slots=True)
+class NormalizedSchedule:
+    """정규화 일정 (분기별 1건)"""
+    id: int
+    sub_project_id: Optional[int]
+    raw_data_id: int
+    year: int
+    quarter: int
+    month_start: int
+    month_end: int
+    start_date: str
+    end_date: str
+    task_category: str
+    task_description: str
+    original_period: str
+
+
+@dataclass(slots=True)
+class NormalizedPerformance:
+    """정규화 성과 지표"""
+    id: int
+    sub_project_id: Optional[int]
+    raw_data_id: int
+    performance_year: int
+    indicator_category: str
+    indicator_type: str
+    value: float
+    unit: str
+    original_text: str
+
+
+@dataclass(slots=True)
+class NormalizedBudget:
+    """정규화 예산 (연도/유형별 1건)"""
+    id: int
+    sub_project_id: Optional[int]
+    raw_data_id: int
+    budget_year: int
+    budget_category: str
+    budget_type: str
+    amount: float
+    currency: str
+    is_actual: bool
+    original_text: str
+
+
+def _record_columns(first) -> Tuple[List[str], Any]:
+    """레코드 타입에 맞는 (컬럼명 목록, 행 튜플 추출 함수) 반환
+
+    dataclass 레코드는 필드 순서, dict 레코드는 키 순서를 컬럼 순서로 사용
+    """
+    if is_dataclass(first):
+        fieldnames = [f.name for f in fields(first)]
+        return fieldnames, attrgetter(*fieldnames)
+    fieldnames = list(first.keys())
+    return fieldnames, itemgetter(*fieldnames)
+
+
+def _write_csv_table(table_name: str, records: List, output_dir: Path) -> None:
+    """테이블 하나를 output_dir/{table_name}.csv로 저장
+
+    인스턴스 상태를 참조하지 않는 모듈 함수이므로 스레드/프로세스 풀 어디에서나 호출 가능
+    """
+    csv_path = output_dir / f"{table_name}.csv"
+
+    # 헤더는 한 번만 계산하고 행은 튜플로 바로 기록 (DictWriter의 행별 키 조회 제거)
+    fieldnames, get_row = _record_columns(records[0])
+
+    with open(csv_path, 'w', newline='', encoding='utf-8-sig', buffering=CSV_WRITE_BUFFER) as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(map(get_row, records))
+
+    logger.info(f"✅ {table_name}.csv 저장 ({len(records)}건)")
+
+
+def _write_parquet_table(table_name: str, records: List, output_dir: Path) -> None:
+    """테이블 하나를 output_dir/{table_name}.parquet로 저장 (zstd 압축, 컬럼 타입 유지)"""
+    # save_to_parquet()에서 이미 로드했으므로 sys.modules 조회만 일어남
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    parquet_path = output_dir / f"{table_name}.parquet"
+
+    # 행 튜플을 한 번 전치하여 컬럼 단위로 Arrow 테이블 구성
+    fieldnames, get_row = _record_columns(records[0])
+    columns = zip(*map(get_row, records))
+    table = pa.table({name: list(column) for name, column in zip(fieldnames, columns)})
+    pq.write_table(table, parquet_path, compression='zstd')
+
+    logger.info(f"✅ {table_name}.parquet 저장 ({len(records)}건)")
+
 
 class GovernmentStandardNormalizer:
     """정부 표준 정규화 클래스 - 모든 데이터 포함"""
@@ -27,16 +294,11 @@ class GovernmentStandardNormalizer:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
 
-        # ID 카운터
+        # 엔티티별 ID 발급기 (itertools.count - next() 한 번으로 발급)
         self.id_counters = {
-            'sub_project': 1,
-            'raw_data': 1,
-            'schedule': 1,
-            'performance': 1,
-            'budget': 1,
-            'overview': 1,
-            'achievement': 1,
-            'plan_detail': 1
+            entity_type: itertools.count(1)
+            for entity_type in ('sub_project', 'raw_data', 'schedule', 'performance',
+                                'budget', 'overview', 'achievement', 'plan_detail')
         }
 
         # 데이터 저장소
@@ -66,6 +328,18 @@ class GovernmentStandardNormalizer:
             'plan_year': 2024
         }
 
+        # 연도별 일정 분기 기간 {연도: {분기: (시작월, 종료월, 시작일, 종료일)}}
+        self._schedule_periods = {}
+
+        # 정규화된 내역사업명(_canonical_name) → ID 인덱스 (중복 등록 체크용)
+        self._sub_project_by_name = {}
+
+        # 테이블 타입 감지 캐시 {(페이지 카테고리, 헤더 행): 타입}
+        self._table_type_cache = {}
+
+        # 원본 데이터 생성 시각 (normalize() 실행마다 한 번만 계산)
+        self._now_iso = datetime.now().isoformat()
+
         # 검증 통계
         self.validation_stats = {
             'total_pages': 0,
@@ -77,9 +351,55 @@ class GovernmentStandardNormalizer:
 
     def _get_next_id(self, entity_type: str) -> int:
         """ID 생성"""
-        current = self.id_counters[entity_type]
-        self.id_counters[entity_type] += 1
-        return current
+        return next(self.id_counters[entity_type])
+
+    def _detect_table_type(self, page_category: str, rows: List[List]) -> Optional[str]:
+        """헤더 행으로 테이블 타입 감지
+
+        performance 페이지: 'budget' 또는 성과 세부 타입
+            ('patent_paper', 'tech_transfer', 'international', 'human_resources', 'performance')
+        plan 페이지: 'schedule', 'budget' 또는 None
+
+        정부 문서는 같은 헤더가 페이지마다 반복되므로 (카테고리, 헤더 행) 단위로 캐시
+        """
+        header = rows[0]
+        try:
+            key = (page_category, tuple(header))
+            cached = self._table_type_cache.get(key, False)
+        except TypeError:  # 해시 불가능한 셀이 있으면 캐시 없이 감지
+            key = None
+            cached = False
+
+        if cached is not False:
+            return cached
+
+        # 헤더에 등장하는 키워드 집합 (한 번의 정규식 스캔)
+        # 키워드가 모두 한글이라 대소문자 변환(lower) 없이 원문 그대로 검사
+        found = set(_TABLE_TYPE_RE.findall(' '.join(map(str, header))))
+        table_type = None
+
+        if page_category == 'performance':
+            if '사업비' in found or {'구분', '실적', '계획'} <= found:
+                table_type = 'budget'
+            elif {'특허성과', '논문성과'} <= found:
+                table_type = 'patent_paper'
+            elif '기술이전' in found or '기술료' in found:
+                table_type = 'tech_transfer'
+            elif '국제협력' in found or '해외연구자' in found:
+                table_type = 'international'
+            elif '학위배출' in found or '박사' in found:
+                table_type = 'human_resources'
+            else:
+                table_type = 'performance'
+        elif page_category == 'plan':
+            if '일정' in found or '분기' in found or '추진' in found:
+                table_type = 'schedule'
+            elif '예산' in found or '사업비' in found:
+                table_type = 'budget'
+
+        if key is not None:
+            self._table_type_cache[key] = table_type
+        return table_type
 
     def _save_raw_data(self, data_type: str, content: Any,
                       page_number: int, table_index: int) -> int:
@@ -92,10 +412,10 @@ class GovernmentStandardNormalizer:
             'data_type': data_type,
             'data_year': self.current_context.get(f'{data_type}_year',
                                                  self.current_context['document_year']),
-            'raw_content': json.dumps(content, ensure_ascii=False) if isinstance(content, (dict, list)) else str(content),
+            'raw_content': _json_dumps(content) if isinstance(content, (dict, list)) else str(content),
             'page_number': page_number,
             'table_index': table_index,
-            'created_at': datetime.now().isoformat()
+            'created_at': self._now_iso
         })
 
         return raw_id
@@ -105,14 +425,14 @@ class GovernmentStandardNormalizer:
         achievements = []
 
         # "① 대표성과" 섹션 찾기
-        match = re.search(r'①\s*대표성과(.*?)(?:②|③|\(2\)|\(3\)|$)', full_text, re.DOTALL)
+        match = _ACHIEVEMENT_SECTION_RE.search(full_text)
         if not match:
             return achievements
 
         achievement_text = match.group(1).strip()
 
         # "○" 기호로 개별 성과 분리
-        individual_achievements = re.split(r'\n○\s+', achievement_text)
+        individual_achievements = _ACHIEVEMENT_SPLIT_RE.split(achievement_text)
 
         for idx, achievement in enumerate(individual_achievements):
             achievement = achievement.strip()
@@ -133,11 +453,11 @@ class GovernmentStandardNormalizer:
         plans = []
 
         # "① 주요 추진계획 내용" 섹션 찾기
-        match = re.search(r'①\s*주요\s*추진계획\s*내용(.*?)(?:②|③|\(2\)|\(3\)|$)', full_text, re.DOTALL)
+        match = _PLAN_SECTION_RE.search(full_text)
 
-        # 패턴1이 없으면 "(3) 2024년도 추진계획" 섹션에서 ① 이후 내용 찾기
+        # 패턴1이 없으면 계획연도의 "(3) YYYY년도 추진계획" 섹션에서 ① 이후 내용 찾기
         if not match:
-            match = re.search(r'\(3\)\s*2024년도\s*추진계획\s*①\s*(.*?)(?:②|③|$)', full_text, re.DOTALL)
+            match = _plan_fallback_re(self.current_context['plan_year']).search(full_text)
 
         if not match:
             return []
@@ -145,7 +465,7 @@ class GovernmentStandardNormalizer:
         plan_text = match.group(1).strip()
 
         # "○" 또는 "-" 기호로 개별 계획 분리
-        individual_plans = re.split(r'\n[○\-]\s+', plan_text)
+        individual_plans = _PLAN_SPLIT_RE.split(plan_text)
 
         for idx, plan in enumerate(individual_plans):
             plan = plan.strip()
@@ -161,11 +481,45 @@ class GovernmentStandardNormalizer:
 
         return plans
 
+    def _build_schedule_record(self, record_id: int, sub_project_id: Optional[int],
+                               year: int, quarter: int, task_category: str,
+                               task_description: str, original_period: str,
+                               raw_data_id: int) -> NormalizedSchedule:
+        """일정 레코드 생성 - quarter가 0이면 연간(1~12월) 일정
+
+        ID와 내역사업 ID는 호출하는 쪽에서 행 루프 밖에 바인딩해 전달
+        """
+        # 연도별 분기 기간(날짜 문자열 포함)은 연도당 한 번만 생성
+        periods = self._schedule_periods.get(year)
+        if periods is None:
+            periods = self._schedule_periods[year] = {
+                q: (month_start, month_end, f"{year}-{start_md}", f"{year}-{end_md}")
+                for q, (month_start, month_end, start_md, end_md) in _QUARTER_PERIODS.items()
+            }
+        month_start, month_end, start_date, end_date = periods[quarter]
+
+        return NormalizedSchedule(
+            id=record_id,
+            sub_project_id=sub_project_id,
+            raw_data_id=raw_data_id,
+            year=year,
+            quarter=quarter,
+            month_start=month_start,
+            month_end=month_end,
+            start_date=start_date,
+            end_date=end_date,
+            task_category=task_category,
+            task_description=task_description,
+            original_period=original_period
+        )
+
     def _normalize_schedule_data(self, period: str, task: str, detail: str,
-                                raw_data_id: int) -> List[Dict]:
+                                raw_data_id: int) -> List[NormalizedSchedule]:
         """일정 데이터 정규화 - 분기별로 철저히 분리"""
         normalized = []
         year = self.current_context['plan_year']
+        sub_project_id = self.current_context['sub_project_id']
+        next_id = self.id_counters['schedule'].__next__
 
         # 헤더나 빈 행 필터링
         if not period or not task or period in ['구분', '추진일정', '추진사항', '항목', '주요내용']:
@@ -183,39 +537,7 @@ class GovernmentStandardNormalizer:
         else:
             task_items = [task]
 
-        # 분기별 종료일 계산
-        def get_quarter_end_date(year: int, quarter: int) -> str:
-            month_end = quarter * 3
-            if month_end == 3:
-                return f"{year}-03-31"
-            elif month_end == 6:
-                return f"{year}-06-30"
-            elif month_end == 9:
-                return f"{year}-09-30"
-            else:  # 12월
-                return f"{year}-12-31"
-
-        # 분기 추출 함수
-        def extract_quarters(period_text):
-            quarters = []
-            # Case 1: 병합된 분기 (1/4분기 ~ 2/4분기)
-            if '~' in period_text and '분기' in period_text:
-                quarter_match = re.search(r'(\d)/4\s*분기\s*~\s*(\d)/4\s*분기', period_text)
-                if quarter_match:
-                    start_q = int(quarter_match.group(1))
-                    end_q = int(quarter_match.group(2))
-                    quarters = list(range(start_q, end_q + 1))
-            # Case 2: 연중
-            elif '연중' in period_text:
-                quarters = [1, 2, 3, 4]
-            # Case 3: 단일 분기
-            elif '분기' in period_text:
-                quarter_match = re.search(r'(\d)/4\s*분기', period_text)
-                if quarter_match:
-                    quarters = [int(quarter_match.group(1))]
-            return quarters
-
-        quarters = extract_quarters(period)
+        quarters = _extract_quarters(period)
 
         # 각 항목별로 레코드 생성
         for task_item in task_items:
@@ -226,316 +548,69 @@ class GovernmentStandardNormalizer:
             # 작업 카테고리 추출 (• 리더연구 등)
             task_category = ""
             if '•' in task_item:
-                # "• 리더연구" 부분 추출
-                first_line = task_item.split('\n')[0].replace('•', '').strip()
-                task_category = first_line
-
-            # 각 분기별로 레코드 생성
-            if quarters:
-                for quarter in quarters:
-                    record = {
-                        'id': self._get_next_id('schedule'),
-                        'sub_project_id': self.current_context['sub_project_id'],
-                        'raw_data_id': raw_data_id,
-                        'year': year,
-                        'quarter': quarter,
-                        'month_start': (quarter - 1) * 3 + 1,
-                        'month_end': quarter * 3,
-                        'start_date': f"{year}-{(quarter-1)*3+1:02d}-01",
-                        'end_date': get_quarter_end_date(year, quarter),
-                        'task_category': task_category,
-                        'task_description': task_item,
-                        'original_period': period
-                    }
-                    normalized.append(record)
-            else:
-                # 분기 정보가 없으면 기본값
-                record = {
-                    'id': self._get_next_id('schedule'),
-                    'sub_project_id': self.current_context['sub_project_id'],
-                    'raw_data_id': raw_data_id,
-                    'year': year,
-                    'quarter': 0,
-                    'month_start': 1,
-                    'month_end': 12,
-                    'start_date': f"{year}-01-01",
-                    'end_date': f"{year}-12-31",
-                    'task_category': task_category,
-                    'task_description': task_item,
-                    'original_period': period
-                }
-                normalized.append(record)
+                # "• 리더연구" 부분 추출 (첫 줄만 필요하므로 전체 줄 목록을 만들지 않음)
+                task_category = task_item.partition('\n')[0].replace('•', '').strip()
+
+            # 각 분기별로 레코드 생성 (분기 정보가 없으면 연간 레코드 1건)
+            for quarter in quarters or (0,):
+                normalized.append(self._build_schedule_record(
+                    next_id(), sub_project_id, year, quarter,
+                    task_category, task_item, period, raw_data_id
+                ))
 
         return normalized
 
-    def _normalize_performance_table(self, rows: List[List], raw_data_id: int) -> List[Dict]:
+    def _normalize_performance_table(self, rows: List[List], raw_data_id: int,
+                                     table_type: str) -> List[NormalizedPerformance]:
         """성과 테이블 정규화 - 모든 성과 지표 포함"""
+        spec = _PERF_SPECS.get(table_type)  # table_type은 _detect_table_type 결과
+        if spec is None or not rows or len(rows) < 2:
+            return []
+
+        min_rows, indicators = spec
+        if len(rows) < min_rows:
+            return []
+
         normalized = []
         year = self.current_context['performance_year']
+        sub_project_id = self.current_context['sub_project_id']
+        next_id = self.id_counters['performance'].__next__
 
-        if not rows or len(rows) < 2:
-            return []
+        # 감사용 원문은 테이블당 한 번만 생성
+        original_text = str(rows)
+        data_row = rows[-1]  # 마지막 행이 실제 데이터
+        row_len = len(data_row)
+
+        for category, indicator_type, idx, unit in indicators:
+            if idx >= row_len:
+                continue
+
+            # 천단위 콤마 제거 후 해당 지표의 단위 접미사만 제거 ("1,234건" → "1234")
+            val_str = str(data_row[idx]).translate(_COMMA_STRIP).strip().removesuffix(unit).rstrip()
+            if not _NUMERIC_RE.fullmatch(val_str):
+                continue
 
-        # 테이블 타입 감지
-        header_text = ' '.join(str(c) for c in rows[0]).lower()
-
-        # 1. 특허/논문 복합 테이블
-        if '특허성과' in header_text and '논문성과' in header_text:
-            if len(rows) >= 4:
-                data_row = rows[-1]  # 마지막 행이 실제 데이터
-
-                # 특허 데이터 추출 (0-3번 컬럼)
-                patent_indicators = [
-                    ('국내출원', 0), ('국내등록', 1),
-                    ('국외출원', 2), ('국외등록', 3)
-                ]
-
-                for indicator_type, idx in patent_indicators:
-                    if idx < len(data_row):
-                        try:
-                            val_str = str(data_row[idx]).replace(',', '').strip()
-                            if val_str and val_str != '-':
-                                val = float(val_str)
-                                if val > 0:
-                                    normalized.append({
-                                        'id': self._get_next_id('performance'),
-                                        'sub_project_id': self.current_context['sub_project_id'],
-                                        'raw_data_id': raw_data_id,
-                                        'performance_year': year,
-                                        'indicator_category': '특허',
-                                        'indicator_type': indicator_type,
-                                        'value': val,
-                                        'unit': '건',
-                                        'original_text': str(rows)
-                                    })
-                        except: pass
-
-                # 논문 데이터 추출 (4-7번 컬럼)
-                paper_indicators = [
-                    ('IF20이상', 4), ('IF10이상', 5),
-                    ('SCIE', 6), ('비SCIE', 7)
-                ]
-
-                for indicator_type, idx in paper_indicators:
-                    if idx < len(data_row):
-                        try:
-                            val_str = str(data_row[idx]).replace(',', '').strip()
-                            if val_str and val_str != '-':
-                                val = float(val_str)
-                                if val > 0:
-                                    normalized.append({
-                                        'id': self._get_next_id('performance'),
-                                        'sub_project_id': self.current_context['sub_project_id'],
-                                        'raw_data_id': raw_data_id,
-                                        'performance_year': year,
-                                        'indicator_category': '논문',
-                                        'indicator_type': indicator_type,
-                                        'value': val,
-                                        'unit': '편',
-                                        'original_text': str(rows)
-                                    })
-                        except: pass
-
-        # 2. 기술이전 테이블
-        elif '기술이전' in header_text or '기술료' in header_text:
-            if len(rows) >= 3:
-                data_row = rows[-1]
-
-                # 기술지도 (0번 컬럼)
-                if len(data_row) > 0:
-                    try:
-                        val_str = str(data_row[0]).replace(',', '').strip()
-                        if val_str and val_str != '-':
-                            val = float(val_str)
-                            if val > 0:
-                                normalized.append({
-                                    'id': self._get_next_id('performance'),
-                                    'sub_project_id': self.current_context['sub_project_id'],
-                                    'raw_data_id': raw_data_id,
-                                    'performance_year': year,
-                                    'indicator_category': '기술이전',
-                                    'indicator_type': '기술지도',
-                                    'value': val,
-                                    'unit': '건',
-                                    'original_text': str(rows)
-                                })
-                    except: pass
-
-                # 기술이전 (1번 컬럼)
-                if len(data_row) > 1:
-                    try:
-                        val_str = str(data_row[1]).replace(',', '').strip()
-                        if val_str and val_str != '-':
-                            val = float(val_str)
-                            if val > 0:
-                                normalized.append({
-                                    'id': self._get_next_id('performance'),
-                                    'sub_project_id': self.current_context['sub_project_id'],
-                                    'raw_data_id': raw_data_id,
-                                    'performance_year': year,
-                                    'indicator_category': '기술이전',
-                                    'indicator_type': '기술이전',
-                                    'value': val,
-                                    'unit': '건',
-                                    'original_text': str(rows)
-                                })
-                    except: pass
-
-                # 기술료 금액 (3번 컬럼)
-                if len(data_row) > 3:
-                    try:
-                        val_str = str(data_row[3]).replace(',', '').strip()
-                        if val_str and val_str != '-':
-                            val = float(val_str)
-                            if val > 0:
-                                normalized.append({
-                                    'id': self._get_next_id('performance'),
-                                    'sub_project_id': self.current_context['sub_project_id'],
-                                    'raw_data_id': raw_data_id,
-                                    'performance_year': year,
-                                    'indicator_category': '기술이전',
-                                    'indicator_type': '기술료',
-                                    'value': val,
-                                    'unit': '백만원',
-                                    'original_text': str(rows)
-                                })
-                    except: pass
-
-        # 3. 국제협력 테이블
-        elif '국제협력' in header_text or '해외연구자' in header_text:
-            if len(rows) >= 3:
-                data_row = rows[-1]
-
-                # 해외연구자 유치 (0번 컬럼)
-                if len(data_row) > 0:
-                    try:
-                        val_str = str(data_row[0]).replace(',', '').strip()
-                        if val_str and val_str != '-':
-                            val = float(val_str)
-                            if val > 0:
-                                normalized.append({
-                                    'id': self._get_next_id('performance'),
-                                    'sub_project_id': self.current_context['sub_project_id'],
-                                    'raw_data_id': raw_data_id,
-                                    'performance_year': year,
-                                    'indicator_category': '국제협력',
-                                    'indicator_type': '해외연구자유치',
-                                    'value': val,
-                                    'unit': '명',
-                                    'original_text': str(rows)
-                                })
-                    except: pass
-
-                # 국내연구자 파견 (1번 컬럼)
-                if len(data_row) > 1:
-                    try:
-                        val_str = str(data_row[1]).replace(',', '').strip()
-                        if val_str and val_str != '-':
-                            val = float(val_str)
-                            if val > 0:
-                                normalized.append({
-                                    'id': self._get_next_id('performance'),
-                                    'sub_project_id': self.current_context['sub_project_id'],
-                                    'raw_data_id': raw_data_id,
-                                    'performance_year': year,
-                                    'indicator_category': '국제협력',
-                                    'indicator_type': '국내연구자파견',
-                                    'value': val,
-                                    'unit': '명',
-                                    'original_text': str(rows)
-                                })
-                    except: pass
-
-                # 국제학술회의 개최 (2번 컬럼)
-                if len(data_row) > 2:
-                    try:
-                        val_str = str(data_row[2]).replace(',', '').strip()
-                        if val_str and val_str != '-':
-                            val = float(val_str)
-                            if val > 0:
-                                normalized.append({
-                                    'id': self._get_next_id('performance'),
-                                    'sub_project_id': self.current_context['sub_project_id'],
-                                    'raw_data_id': raw_data_id,
-                                    'performance_year': year,
-                                    'indicator_category': '국제협력',
-                                    'indicator_type': '국제학술회의개최',
-                                    'value': val,
-                                    'unit': '건',
-                                    'original_text': str(rows)
-                                })
-                    except: pass
-
-        # 4. 인력양성 테이블
-        elif '학위배출' in header_text or '박사' in header_text:
-            if len(rows) >= 3:
-                data_row = rows[-1]
-
-                # 박사 (0번 컬럼)
-                if len(data_row) > 0:
-                    try:
-                        val_str = str(data_row[0]).replace(',', '').strip()
-                        if val_str and val_str != '-':
-                            val = float(val_str)
-                            if val > 0:
-                                normalized.append({
-                                    'id': self._get_next_id('performance'),
-                                    'sub_project_id': self.current_context['sub_project_id'],
-                                    'raw_data_id': raw_data_id,
-                                    'performance_year': year,
-                                    'indicator_category': '인력양성',
-                                    'indicator_type': '박사배출',
-                                    'value': val,
-                                    'unit': '명',
-                                    'original_text': str(rows)
-                                })
-                    except: pass
-
-                # 석사 (1번 컬럼)
-                if len(data_row) > 1:
-                    try:
-                        val_str = str(data_row[1]).replace(',', '').strip()
-                        if val_str and val_str != '-':
-                            val = float(val_str)
-                            if val > 0:
-                                normalized.append({
-                                    'id': self._get_next_id('performance'),
-                                    'sub_project_id': self.current_context['sub_project_id'],
-                                    'raw_data_id': raw_data_id,
-                                    'performance_year': year,
-                                    'indicator_category': '인력양성',
-                                    'indicator_type': '석사배출',
-                                    'value': val,
-                                    'unit': '명',
-                                    'original_text': str(rows)
-                                })
-                    except: pass
-
-                # 연구과제 참여인력 (4번 컬럼)
-                if len(data_row) > 4:
-                    try:
-                        val_str = str(data_row[4]).replace(',', '').strip()
-                        if val_str and val_str != '-':
-                            val = float(val_str)
-                            if val > 0:
-                                normalized.append({
-                                    'id': self._get_next_id('performance'),
-                                    'sub_project_id': self.current_context['sub_project_id'],
-                                    'raw_data_id': raw_data_id,
-                                    'performance_year': year,
-                                    'indicator_category': '인력양성',
-                                    'indicator_type': '연구과제참여인력',
-                                    'value': val,
-                                    'unit': '명',
-                                    'original_text': str(rows)
-                                })
-                    except: pass
+            val = float(val_str)
+            if val > 0:
+                normalized.append(NormalizedPerformance(
+                    id=next_id(),
+                    sub_project_id=sub_project_id,
+                    raw_data_id=raw_data_id,
+                    performance_year=year,
+                    indicator_category=category,
+                    indicator_type=indicator_type,
+                    value=val,
+                    unit=unit,
+                    original_text=original_text
+                ))
 
         return normalized
 
-    def _normalize_budget_data(self, rows: List[List], raw_data_id: int) -> List[Dict]:
+    def _normalize_budget_data(self, rows: List[List], raw_data_id: int) -> List[NormalizedBudget]:
         """예산 데이터 정규화 - 연도별/유형별 분리"""
         normalized = []
+        sub_project_id = self.current_context['sub_project_id']
+        plan_year = self.current_context['plan_year']
 
         if not rows or len(rows) < 2:
             return []
@@ -545,14 +620,17 @@ class GovernmentStandardNormalizer:
         year_columns = {}  # {컬럼 인덱스: (연도, 실적/계획)}
 
         for row in rows:
-            row_text = ' '.join(str(c) for c in row).lower()
+            row_text = ' '.join(map(str, row))
             # "사업비 구분" 같은 헤더 행 찾기
             if '사업비' in row_text or ('구분' in row_text and '20' in row_text):
                 # 헤더 행 발견 - 각 컬럼에서 연도 추출
                 for idx, cell in enumerate(row):
                     cell_str = str(cell).strip()
+                    # 연도 토큰이 없는 셀은 정규식 호출 없이 건너뜀
+                    if '20' not in cell_str:
+                        continue
                     # 연도 찾기 (2021년 실적, 2024년 계획 등)
-                    year_match = re.search(r'(20\d{2})', cell_str)
+                    year_match = _YEAR_RE.search(cell_str)
                     if year_match:
                         year = int(year_match.group(1))
                         is_actual = '실적' in cell_str
@@ -565,8 +643,8 @@ class GovernmentStandardNormalizer:
 
         # 데이터 행 처리
         for row in rows:
-            # 헤더 행 건너뛰기
-            if row == header_row:
+            # 헤더 행 건너뛰기 (header_row는 rows의 원소 그 자체이므로 동일 객체 비교로 충분)
+            if row is header_row:
                 continue
 
             # 빈 행 건너뛰기
@@ -574,24 +652,24 @@ class GovernmentStandardNormalizer:
                 continue
 
             # 첫 번째 컬럼에서 예산 타입 추출
-            budget_type_text = str(row[0]).strip().lower()
+            budget_type_text = str(row[0]).strip()
 
             # "소계", "합계" 건너뛰기
-            if any(skip in budget_type_text for skip in ['소계', '합계', '총계', '구분']):
+            if _BUDGET_SKIP_RE.search(budget_type_text):
                 continue
 
-            # 예산 타입 결정
-            budget_type = None
-            if '정부' in budget_type_text or '국비' in budget_type_text:
-                budget_type = '정부'
-            elif '민간' in budget_type_text:
-                budget_type = '민간'
-            elif '지방' in budget_type_text:
-                budget_type = '지방비'
-            else:
+            # 예산 타입 결정 (먼저 일치하는 키워드 우선)
+            budget_type = next(
+                (btype for keyword, btype in _BUDGET_TYPE_KEYWORDS if keyword in budget_type_text),
+                None
+            )
+            if budget_type is None:
                 # 알 수 없는 타입은 건너뛰기
                 continue
 
+            # 감사용 원문은 행당 한 번만 생성
+            original_text = str(row)
+
             # 각 연도 컬럼 처리
             for col_idx, (year, category) in year_columns.items():
                 if col_idx >= len(row):
@@ -603,58 +681,52 @@ class GovernmentStandardNormalizer:
                 if not cell_str or cell_str in ['-', '', 'nan']:
                     continue
 
-                try:
-                    amount = float(cell_str.replace(',', '').replace('백만원', '').strip())
-                    if amount <= 0:
-                        continue
+                # 숫자 형식이 아니면 float() 예외 경로를 타지 않고 바로 건너뜀
+                amount_str = cell_str.translate(_COMMA_STRIP).removesuffix('백만원').rstrip()
+                if not _NUMERIC_RE.fullmatch(amount_str):
+                    continue
 
-                    # 실적/계획 구분 (연도 기준)
-                    is_actual = year < self.current_context['plan_year'] or category == '실적'
-
-                    record = {
-                        'id': self._get_next_id('budget'),
-                        'sub_project_id': self.current_context['sub_project_id'],
-                        'raw_data_id': raw_data_id,
-                        'budget_year': year,
-                        'budget_category': category,
-                        'budget_type': budget_type,
-                        'amount': amount,
-                        'currency': 'KRW',
-                        'is_actual': is_actual,
-                        'original_text': str(row)
-                    }
-                    normalized.append(record)
-
-                except (ValueError, TypeError):
+                amount = float(amount_str)
+                if amount <= 0:
                     continue
 
+                # 실적/계획 구분 (연도 기준)
+                is_actual = year < plan_year or category == '실적'
+
+                record = NormalizedBudget(
+                    id=self._get_next_id('budget'),
+                    sub_project_id=sub_project_id,
+                    raw_data_id=raw_data_id,
+                    budget_year=year,
+                    budget_category=category,
+                    budget_type=budget_type,
+                    amount=amount,
+                    currency='KRW',
+                    is_actual=is_actual,
+                    original_text=original_text
+                )
+                normalized.append(record)
+
         return normalized
 
-    def _process_overview(self, full_text: str, tables: List[Dict], page_number: int, raw_data_id: int):
-        """사업개요 처리 - 전체 텍스트와 테이블 모두 사용"""
+    def _process_overview(self, full_text: str, key_values: List[Tuple[str, str]],
+                          page_number: int, raw_data_id: int):
+        """사업개요 처리 - 전체 텍스트와 테이블(_table_key_values 결과) 모두 사용"""
 
         # 테이블에서 기본 정보 추출
-        overview_data = {}
-        for table in tables:
-            rows = table.get('data', [])
-            for row in rows:
-                if len(row) >= 2:
-                    key = str(row[0]).strip()
-                    value = str(row[1]).strip()
-                    if key and value:
-                        overview_data[key] = value
+        overview_data = {key: value for key, value in key_values if key and value}
 
         # full_text에서 사업목표, 사업내용 추출
         objective = ""
         content = ""
 
         # 사업목표 추출
-        obj_match = re.search(r'○\s*사업목표\s*(.*?)(?:○\s*사업내용|$)', full_text, re.DOTALL)
+        obj_match = _OBJECTIVE_RE.search(full_text)
         if obj_match:
             objective = obj_match.group(1).strip()
 
         # 사업내용 추출
-        content_match = re.search(r'○\s*사업내용\s*(.*?)(?:\(2\)|②|$)', full_text, re.DOTALL)
+        content_match = _CONTENT_RE.search(full_text)
         if content_match:
             content = content_match.group(1).strip()
 
@@ -674,34 +746,26 @@ class GovernmentStandardNormalizer:
             'managing_org': overview_data.get('관리기관', '')
         })
 
-    def _process_sub_project(self, text: str, tables: List[Dict]) -> bool:
-        """내역사업 처리"""
+    def _process_sub_project(self, text: str, key_values: List[Tuple[str, str]]) -> bool:
+        """내역사업 처리 (key_values는 페이지 테이블의 _table_key_values 결과)"""
         sub_project_name = None
         main_project_name = None
 
         # 테이블에서 찾기
-        for table in tables:
-            rows = table.get('data', [])
-            for row in rows:
-                if len(row) < 2:
-                    continue
-
-                key = str(row[0]).strip()
-                value = str(row[1]).strip()
-
-                if '내역사업명' in key and value:
-                    sub_project_name = value
-                elif '세부사업명' in key:
-                    main_project_name = value
+        for key, value in key_values:
+            if '내역사업명' in key and value:
+                sub_project_name = value
+            elif '세부사업명' in key:
+                main_project_name = value
 
         # 텍스트에서 찾기 (테이블에서 못 찾았을 경우)
         if not sub_project_name:
-            match = re.search(r'내역사업명\s+([^\n]+)', text)
+            match = _SUB_PROJECT_NAME_RE.search(text)
             if match:
                 sub_project_name = match.group(1).strip()
 
         if not main_project_name:
-            match = re.search(r'세부사업명\s+([^\n]+)', text)
+            match = _MAIN_PROJECT_NAME_RE.search(text)
             if match:
                 main_project_name = match.group(1).strip()
 
@@ -709,11 +773,11 @@ class GovernmentStandardNormalizer:
             return False
 
         # 이미 등록된 내역사업인지 체크
-        for proj in self.data['sub_projects']:
-            if proj['sub_project_name'] == sub_project_name:
-                self.current_context['sub_project_id'] = proj['id']
-                logger.info(f"📌 기존 내역사업 재사용: {sub_project_name} (ID: {proj['id']})")
-                return True
+        existing_id = self._sub_project_by_name.get(_canonical_name(sub_project_name))
+        if existing_id is not None:
+            self.current_context['sub_project_id'] = existing_id
+            logger.info("📌 기존 내역사업 재사용: %s (ID: %d)", sub_project_name, existing_id)
+            return True
 
         # 새로운 내역사업 생성
         sub_id = self._get_next_id('sub_project')
@@ -727,15 +791,150 @@ class GovernmentStandardNormalizer:
         }
 
         self.data['sub_projects'].append(project)
+        self._sub_project_by_name[_canonical_name(sub_project_name)] = sub_id
         self.current_context['sub_project_id'] = sub_id
 
-        logger.info(f"✅ 내역사업 등록: {sub_project_name} (ID: {sub_id})")
+        logger.info("✅ 내역사업 등록: %s (ID: %d)", sub_project_name, sub_id)
         return True
 
+    def load_json(self) -> Dict:
+        """json_path의 추출 JSON 로드 (바이트로 읽어 한 번에 파싱)"""
+        with open(self.json_path, 'rb') as f:
+            return _json_loads(f.read())
+
+    def _process_page(self, page: Dict, plan_heading: str):
+        """페이지 하나 처리 - 내역사업 전환/등록, 원본 저장, 텍스트 추출, 테이블 정규화"""
+        page_num = page.get('page_number', 1)
+        page_category = page.get('category')
+        page_sub_project = page.get('sub_project')
+        page_full_text = page.get('full_text', '')
+        page_tables = page.get('tables', [])
+
+        self.validation_stats['total_tables'] += len(page_tables)
+
+        # 키-값 테이블 쌍은 필요한 페이지에서만 한 번 생성해 공유
+        page_key_values = None
+
+        # sub_project가 페이지에 명시되어 있으면 설정/전환 (null이 아닐 때만)
+        if page_sub_project:
+            # 이미 등록된 내역사업인지 체크
+            existing_id = self._sub_project_by_name.get(_canonical_name(page_sub_project))
+
+            if existing_id is not None:
+                # 기존 프로젝트로 전환
+                if self.current_context.get('sub_project_id') != existing_id:
+                    self.current_context['sub_project_id'] = existing_id
+                    logger.info("📌 내역사업 전환: %s (ID: %d)", page_sub_project, existing_id)
+            else:
+                # 새로운 내역사업 처리
+                page_key_values = _table_key_values(page_tables)
+                self._process_sub_project(page_full_text, page_key_values)
+        else:
+            # 페이지에 sub_project 정보가 없으면 텍스트/테이블에서 찾기
+            if '내역사업명' in page_full_text:
+                page_key_values = _table_key_values(page_tables)
+                self._process_sub_project(page_full_text, page_key_values)
+
+        # sub_project_id가 없으면 건너뛰기
+        if not self.current_context.get('sub_project_id'):
+            return
+
+        # 원본 데이터 저장
+        raw_data_id = self._save_raw_data(
+            page_category or 'unknown',
+            {'full_text': page_full_text, 'tables': page_tables},
+            page_num,
+            0
+        )
+
+        # ⭐ 대표성과와 주요계획은 모든 페이지에서 추출 (category와 무관)
+        # (sub_project_id가 없는 페이지는 위에서 이미 건너뜀)
+        # 대표성과 추출
+        if '① 대표성과' in page_full_text:
+            achievements = self._extract_key_achievements(page_full_text, page_num)
+            self.data['key_achievements'].extend(achievements)
+
+        # 주요 추진계획 추출 (여러 패턴 지원)
+        if ('① 주요 추진계획' in page_full_text or
+            '① 주요추진계획' in page_full_text or
+            plan_heading in page_full_text):
+            plan_details = self._extract_plan_details(page_full_text, page_num)
+            self.data['plan_details'].extend(plan_details)
+
+        # 카테고리별 처리
+        if page_category == 'overview':
+            # 사업개요 처리
+            if page_key_values is None:
+                page_key_values = _table_key_values(page_tables)
+            self._process_overview(page_full_text, page_key_values, page_num, raw_data_id)
+
+        elif page_category == 'performance':
+
+            # 테이블 처리 (성과 또는 예산)
+            for idx, table in enumerate(page_tables):
+                rows = table.get('data', [])
+                if not rows:
+                    continue
+
+                table_type = self._detect_table_type(page_category, rows)
+
+                # 예산 테이블인지 확인 (performance 카테고리에 예산 테이블이 있을 수 있음)
+                if table_type == 'budget':
+                    # 예산 테이블
+                    table_raw_id = self._save_raw_data('plan', table, page_num, idx)
+                    normalized = self._normalize_budget_data(rows, table_raw_id)
+                    self.data['normalized_budgets'].extend(normalized)
+                    self.validation_stats['normalized_records'] += len(normalized)
+                else:
+                    # 성과 테이블
+                    table_raw_id = self._save_raw_data('performance', table, page_num, idx)
+                    normalized = self._normalize_performance_table(rows, table_raw_id, table_type)
+                    self.data['normalized_performances'].extend(normalized)
+                    self.validation_stats['normalized_records'] += len(normalized)
+
+                self.validation_stats['processed_tables'] += 1
+
+        elif page_category == 'plan':
+
+            # 테이블 처리
+            for idx, table in enumerate(page_tables):
+                rows = table.get('data', [])
+                if not rows:
+                    continue
+
+                table_raw_id = self._save_raw_data('plan', table, page_num, idx)
+
+                # 테이블 타입 감지
+                table_type = self._detect_table_type(page_category, rows)
+
+                if table_type == 'schedule':
+                    # 일정 테이블
+                    for row in rows[1:]:
+                        if len(row) >= 2:
+                            period = str(row[0]).strip()
+                            task = str(row[1]).strip() if len(row) > 1 else ""
+                            detail = str(row[2]).strip() if len(row) > 2 else ""
+
+                            if period and '구분' not in period:
+                                normalized = self._normalize_schedule_data(
+                                    period, task, detail, table_raw_id
+                                )
+                                self.data['normalized_schedules'].extend(normalized)
+                                self.validation_stats['normalized_records'] += len(normalized)
+
+                elif table_type == 'budget':
+                    # 예산 테이블
+                    normalized = self._normalize_budget_data(rows, table_raw_id)
+                    self.data['normalized_budgets'].extend(normalized)
+                    self.validation_stats['normalized_records'] += len(normalized)
+
+                self.validation_stats['processed_tables'] += 1
+
     def normalize(self, json_data: Dict) -> bool:
         """JSON 데이터 정규화 (전체 처리)"""
         try:
             logger.info(f"🚀 정부 표준 정규화 시작")
+            self._now_iso = datetime.now().isoformat()
 
             # 메타데이터에서 문서 연도 추출
             metadata = json_data.get('metadata', {})
@@ -743,159 +942,72 @@ class GovernmentStandardNormalizer:
             self.current_context['performance_year'] = self.current_context['document_year'] - 1
             self.current_context['plan_year'] = self.current_context['document_year']
 
+            # 계획연도 추진계획 섹션 제목 (예: "(3) 2024년도 추진계획")
+            plan_heading = f"(3) {self.current_context['plan_year']}년도 추진계획"
+
             # 페이지별 처리
             pages_data = json_data.get('pages', [])
             self.validation_stats['total_pages'] = len(pages_data)
 
             for page in pages_data:
-                page_num = page.get('page_number', 1)
-                page_category = page.get('category')
-                page_sub_project = page.get('sub_project')
-                page_full_text = page.get('full_text', '')
-                page_tables = page.get('tables', [])
-
-                self.validation_stats['total_tables'] += len(page_tables)
-
-                # sub_project가 페이지에 명시되어 있으면 설정/전환 (null이 아닐 때만)
-                if page_sub_project:
-                    # 이미 등록된 내역사업인지 체크
-                    existing_project = None
-                    for proj in self.data['sub_projects']:
-                        if proj['sub_project_name'] == page_sub_project:
-                            existing_project = proj
-                            break
-
-                    if existing_project:
-                        # 기존 프로젝트로 전환
-                        if self.current_context.get('sub_project_id') != existing_project['id']:
-                            self.current_context['sub_project_id'] = existing_project['id']
-                            logger.info(f"📌 내역사업 전환: {page_sub_project} (ID: {existing_project['id']})")
-                    else:
-                        # 새로운 내역사업 처리
-                        self._process_sub_project(page_full_text, page_tables)
-                else:
-                    # 페이지에 sub_project 정보가 없으면 텍스트/테이블에서 찾기
-                    if '내역사업명' in page_full_text:
-                        self._process_sub_project(page_full_text, page_tables)
-
-                # sub_project_id가 없으면 건너뛰기
-                if not self.current_context.get('sub_project_id'):
-                    continue
-
-                # 원본 데이터 저장
-                raw_data_id = self._save_raw_data(
-                    page_category or 'unknown',
-                    {'full_text': page_full_text, 'tables': page_tables},
-                    page_num,
-                    0
-                )
-
-                # ⭐ 대표성과와 주요계획은 모든 페이지에서 추출 (category와 무관)
-                if self.current_context.get('sub_project_id'):
-                    # 대표성과 추출
-                    if '① 대표성과' in page_full_text:
-                        achievements = self._extract_key_achievements(page_full_text, page_num)
-                        self.data['key_achievements'].extend(achievements)
-
-                    # 주요 추진계획 추출 (여러 패턴 지원)
-                    if ('① 주요 추진계획' in page_full_text or
-                        '① 주요추진계획' in page_full_text or
-                        '(3) 2024년도 추진계획' in page_full_text):
-                        plan_details = self._extract_plan_details(page_full_text, page_num)
-                        self.data['plan_details'].extend(plan_details)
-
-                # 카테고리별 처리
-                if page_category == 'overview':
-                    # 사업개요 처리
-                    self._process_overview(page_full_text, page_tables, page_num, raw_data_id)
-
-                elif page_category == 'performance':
-
-                    # 테이블 처리 (성과 또는 예산)
-                    for idx, table in enumerate(page_tables):
-                        rows = table.get('data', [])
-                        if not rows:
-                            continue
-
-                        # 테이블 타입 감지
-                        header_text = ' '.join(str(c) for c in rows[0]).lower()
-
-                        # 예산 테이블인지 확인 (performance 카테고리에 예산 테이블이 있을 수 있음)
-                        if '사업비' in header_text or ('구분' in header_text and '실적' in header_text and '계획' in header_text):
-                            # 예산 테이블
-                            table_raw_id = self._save_raw_data('plan', table, page_num, idx)
-                            normalized = self._normalize_budget_data(rows, table_raw_id)
-                            self.data['normalized_budgets'].extend(normalized)
-                            self.validation_stats['normalized_records'] += len(normalized)
-                        else:
-                            # 성과 테이블
-                            table_raw_id = self._save_raw_data('performance', table, page_num, idx)
-                            normalized = self._normalize_performance_table(rows, table_raw_id)
-                            self.data['normalized_performances'].extend(normalized)
-                            self.validation_stats['normalized_records'] += len(normalized)
-
-                        self.validation_stats['processed_tables'] += 1
-
-                elif page_category == 'plan':
-
-                    # 테이블 처리
-                    for idx, table in enumerate(page_tables):
-                        rows = table.get('data', [])
-                        if not rows:
-                            continue
-
-                        table_raw_id = self._save_raw_data('plan', table, page_num, idx)
-
-                        # 테이블 타입 감지
-                        header_text = ' '.join(str(c) for c in rows[0]).lower()
-
-                        if '일정' in header_text or '분기' in header_text or '추진' in header_text:
-                            # 일정 테이블
-                            for row in rows[1:]:
-                                if len(row) >= 2:
-                                    period = str(row[0]).strip()
-                                    task = str(row[1]).strip() if len(row) > 1 else ""
-                                    detail = str(row[2]).strip() if len(row) > 2 else ""
-
-                                    if period and '구분' not in period:
-                                        normalized = self._normalize_schedule_data(
-                                            period, task, detail, table_raw_id
-                                        )
-                                        self.data['normalized_schedules'].extend(normalized)
-                                        self.validation_stats['normalized_records'] += len(normalized)
-
-                        elif '예산' in header_text or '사업비' in header_text:
-                            # 예산 테이블
-                            normalized = self._normalize_budget_data(rows, table_raw_id)
-                            self.data['normalized_budgets'].extend(normalized)
-                            self.validation_stats['normalized_records'] += len(normalized)
-
-                        self.validation_stats['processed_tables'] += 1
+                # 핸들러에서 다시 페이지를 조회하지 않도록 미리 확보 (dict가 아닌 페이지 대비)
+                page_num = page.get('page_number') if isinstance(page, dict) else None
+                row_counts = {table_name: len(records) for table_name, records in self.data.items()
+                              if isinstance(records, list)}
+                try:
+                    self._process_page(page, plan_heading)
+                except Exception as e:
+                    # 한 페이지의 오류로 전체 정규화를 중단하지 않고 기록 후 다음 페이지 진행
+                    # 실패 전까지 추가된 행은 유지하되, 테이블별 건수를 오류에 함께 기록
+                    partial_rows = {table_name: len(self.data[table_name]) - count
+                                    for table_name, count in row_counts.items()
+                                    if len(self.data[table_name]) > count}
+                    logger.exception("페이지 %s 처리 실패: %s", page_num, e)
+                    self.validation_stats['errors'].append({
+                        'page_number': page_num,
+                        'error': str(e),
+                        'partial_rows': partial_rows
+                    })
 
             logger.info(f"✅ 정규화 완료: {len(self.data['sub_projects'])}개 내역사업")
             return True
 
         except Exception as e:
-            logger.error(f"처리 실패: {e}")
-            import traceback
-            traceback.print_exc()
+            # 트레이스백은 로거로 남겨 출력 경로/레벨을 호출자가 제어할 수 있게 함
+            logger.exception("처리 실패: %s", e)
             return False
 
     def save_to_csv(self):
-        """CSV 저장"""
-        for table_name, records in self.data.items():
-            if not records or table_name == 'data_statistics':
-                continue
+        """CSV 저장 - 테이블별 파일을 스레드 풀에서 동시에 기록"""
+        tables = [(table_name, records) for table_name, records in self.data.items()
+                  if records and table_name != 'data_statistics']
+
+        with ThreadPoolExecutor(max_workers=CSV_WRITE_WORKERS) as executor:
+            futures = [executor.submit(_write_csv_table, table_name, records, self.output_dir)
+                       for table_name, records in tables]
+            # result()로 작업 중 발생한 예외를 호출자에게 전달
+            for future in futures:
+                future.result()
+
+    def save_to_parquet(self) -> bool:
+        """Parquet 저장 - 분석용 출력 (DB 적재는 save_to_csv의 CSV를 사용)"""
+        # pyarrow는 선택 사항이며 로드 비용이 커서 Parquet 저장 시에만 import
+        try:
+            import pyarrow.parquet  # noqa: F401
+        except ImportError:
+            logger.warning("pyarrow 미설치 - Parquet 저장을 건너뜁니다 (pip install pyarrow)")
+            return False
 
-            csv_path = self.output_dir / f"{table_name}.csv"
+        tables = [(table_name, records) for table_name, records in self.data.items()
+                  if records and table_name != 'data_statistics']
 
-            with open(csv_path, 'w', newline='', encoding='utf-8-sig') as f:
-                if records:
-                    writer = csv.DictWriter(f, fieldnames=records[0].keys())
-                    writer.writeheader()
-                    writer.writerows(records)
+        with ThreadPoolExecutor(max_workers=CSV_WRITE_WORKERS) as executor:
+            futures = [executor.submit(_write_parquet_table, table_name, records, self.output_dir)
+                       for table_name, records in tables]
+            for future in futures:
+                future.result()
 
-            logger.info(f"✅ {table_name}.csv 저장 ({len(records)}건)")
+        return True
 
     def print_statistics(self):
         """통계 출력"""
@@ -916,6 +1028,16 @@ class GovernmentStandardNormalizer:
         print(f"  대표성과: {len(self.data['key_achievements'])}건")
         print(f"  주요계획: {len(self.data['plan_details'])}건")
 
+        errors = self.validation_stats['errors']
+        if errors:
+            print(f"\n⚠️ 처리 실패 페이지: {len(errors)}건")
+            for error in errors:
+                print(f"  - 페이지 {error['page_number']}: {error['error']}")
+                if error['partial_rows']:
+                    kept = ', '.join(f"{table_name} {count}건"
+                                     for table_name, count in error['partial_rows'].items())
+                    print(f"    (실패 전 추가된 행 유지: {kept})")
+
         print("="*80 + "\n")
 
 
@@ -925,9 +1047,7 @@ if __name__ == "__main__":
 
     if Path(json_file).exists():
         normalizer = GovernmentStandardNormalizer(json_file, output_folder)
-
-        with open(json_file, 'r', encoding='utf-8') as f:
-            json_data = json.load(f)
+        json_data = normalizer.load_json()
 
         success = normalizer.normalize(json_data)
 